@@ -1,19 +1,33 @@
 """
 sqlglot (Python) benchmarks — counterpart to bench_ts.bench.ts.
 
-Measures: parse, generate (parse→sql), and cross-dialect transpile.
-Uses the same SQL queries as the TypeScript benchmarks for comparison.
-
-Outputs JSON to stdout in a format the comparison script can consume.
+Measures: parse, parse_from_tokens (parse a pre-tokenized query), generate
+(sql() on a pre-parsed tree), parse_and_generate (parse→sql), and cross-dialect
+transpile. Uses the same SQL queries as the TypeScript benchmarks for comparison.
+
+The generate benchmarks parse each query once up front and time only code
+generation, so parse cost doesn't dominate the metric. parse_and_generate keeps
+the end-to-end number.
+
+Outputs newline-delimited JSON to stdout as benchmarks finish, in a format the
+comparison script can consume. With --json, a single JSON document keyed by
+"group > name" is printed once all benchmarks are done instead, as in earlier
+versions of this script.
 """
 
+import argparse
+import gc
 import json
 import logging
+import multiprocessing
 import os
 import statistics
 import time
+import timeit
+from contextlib import contextmanager
 
-import sqlglot
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ErrorLevel
 
 logging.disable(logging.WARNING)
 
@@ -22,80 +36,216 @@ QUERIES_PATH = os.path.join(os.path.dirname(__file__), "queries.json")
 with open(QUERIES_PATH) as f:
     QUERIES = json.load(f)
 
-# Warm-up iterations before timing
-WARMUP = 50
-# Number of timed iterations
-ITERATIONS = 500
+# Warm up for this many seconds, capped at MAX_WARMUP calls
+WARMUP_SECONDS = 0.3
+MAX_WARMUP = 50
+# Number of timed repeats; each repeat runs fn enough times to take ~0.2s
+REPEAT = 10
 
 
-def bench(fn, warmup=WARMUP, iterations=ITERATIONS):
-    """Run fn for warmup+iterations, return per-call stats in seconds."""
-    for _ in range(warmup):
-        fn()
+@contextmanager
+def stable_measurement():
+    """Reduce timing noise from CPU migration.
+
+    On platforms with os.sched_setaffinity, the process is pinned to the CPU given by the
+    BENCH_CPU environment variable, if it's set. For example:
+
+        BENCH_CPU=2 python -m benchmarks.bench_py --serial
+
+    Pinning is opt-in because runs with --jobs > 1 would otherwise all share one CPU.
+    """
+    cpu = os.environ.get("BENCH_CPU")
+    affinity = None
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {int(cpu)})
 
-    times = []
-    for _ in range(iterations):
-        t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        if affinity is not None:
+            os.sched_setaffinity(0, affinity)
+
+
+def bench(fn, repeat=REPEAT, warmup_seconds=WARMUP_SECONDS, max_warmup=MAX_WARMUP):
+    """Time fn with timeit and return per-call stats in seconds.
+
+    fn is first warmed up until warmup_seconds have elapsed or max_warmup calls
+    were made, whichever comes first. The inner loop count is then picked by
+    Timer.autorange and each sample is the mean per-call time of one repeat.
+    """
+    warmup_iters = 0
+    start = time.perf_counter()
+    while warmup_iters < max_warmup and time.perf_counter() - start < warmup_seconds:
         fn()
-        t1 = time.perf_counter()
-        times.append(t1 - t0)
+        warmup_iters += 1
+
+    # timeit disables the collector inside each timed loop. Parsed trees are cyclic (parent
+    # links), so collect between loops instead of letting garbage pile up across repeats
+    timer = timeit.Timer(fn, timer=time.perf_counter)
+    with stable_measurement():
+        gc.collect()
+        number, _ = timer.autorange()
+        times = []
+        for _ in range(repeat):
+            gc.collect()
+            times.extend(timer.repeat(repeat=1, number=number))
+        times = sorted(t / number for t in times)
+    mean = statistics.fmean(times)
 
     return {
-        "mean": statistics.mean(times),
+        "mean": mean,
         "median": statistics.median(times),
-        "min": min(times),
-        "max": max(times),
-        "stddev": statistics.stdev(times) if len(times) > 1 else 0,
+        "min": times[0],
+        "max": times[-1],
+        "stddev": statistics.stdev(times, mean) if len(times) > 1 else 0,
         "samples": len(times),
+        "loops": number,
+        "warmup_iters": warmup_iters,
     }
 
 
-def run_benchmarks():
-    results = {}
-
-    # --- Parse ---
-    for name in ("short", "long", "tpch"):
-        sql = QUERIES[name]
-        results[f"parse > {name}"] = bench(
-            lambda s=sql: sqlglot.parse_one(s, error_level=sqlglot.ErrorLevel.IGNORE)
-        )
-
-    # --- Generate (parse + sql()) ---
-    for name in ("short", "long", "tpch"):
-        sql = QUERIES[name]
-        results[f"generate > {name}"] = bench(
-            lambda s=sql: sqlglot.parse_one(
-                s, error_level=sqlglot.ErrorLevel.IGNORE
-            ).sql()
-        )
-
-    # --- Transpile ---
-    results["transpile > postgres_to_mysql"] = bench(
-        lambda: sqlglot.transpile(
-            QUERIES["transpile_postgres_to_mysql"],
-            read="postgres",
-            write="mysql",
-            error_level=sqlglot.ErrorLevel.IGNORE,
-        )
-    )
-
-    results["transpile > tpch_to_bigquery"] = bench(
-        lambda: sqlglot.transpile(
-            QUERIES["transpile_tpch_to_bigquery"],
-            write="bigquery",
-            error_level=sqlglot.ErrorLevel.IGNORE,
-        )
-    )
-
-    results["transpile > tpch_identity"] = bench(
-        lambda: sqlglot.transpile(
-            QUERIES["tpch"], error_level=sqlglot.ErrorLevel.IGNORE
-        )
-    )
-
-    return results
+def make_parse(dialect):
+    """Return a parse(sql) function backed by a tokenizer and parser built once."""
+    tokenizer = dialect.tokenizer()
+    parser = dialect.parser(error_level=ErrorLevel.IGNORE)
+    return lambda sql, parse=parser.parse, tokenize=tokenizer.tokenize: parse(tokenize(sql), sql)
+
+
+def make_transpile(read, write):
+    """Return a transpile(sql) function equivalent to sqlglot.transpile."""
+    parse = make_parse(read)
+    generate = write.generator().generate
+    return lambda sql, parse=parse, generate=generate: [
+        generate(expression, copy=False) if expression else "" for expression in parse(sql)
+    ]
+
+
+# The setup_* functions build the function to time for a given query. Dialects,
+# tokenizers, parsers and generators are built here, outside the timed function,
+# so only tokenizing, parsing and generating is measured. The timed lambdas bind what
+# they use as default arguments, so each call does fast local lookups instead of
+# closure/global ones.
+
+
+def setup_parse(sql):
+    parse = make_parse(Dialect.get_or_raise(None))
+    return lambda parse=parse, sql=sql: parse(sql)
+
+
+def setup_parse_from_tokens(sql):
+    # The parser doesn't mutate its input tokens, so they can be shared across calls
+    dialect = Dialect.get_or_raise(None)
+    tokens = dialect.tokenizer().tokenize(sql)
+    parser = dialect.parser(error_level=ErrorLevel.IGNORE)
+    return lambda parse=parser.parse, tokens=tokens, sql=sql: parse(tokens, sql)
+
+
+def setup_generate(sql):
+    dialect = Dialect.get_or_raise(None)
+    tree = make_parse(dialect)(sql)[0]
+    generate = dialect.generator().generate
+    return lambda generate=generate, tree=tree: generate(tree)
+
+
+def setup_parse_and_generate(sql):
+    dialect = Dialect.get_or_raise(None)
+    parse = make_parse(dialect)
+    generate = dialect.generator().generate
+    return lambda generate=generate, parse=parse, sql=sql: generate(parse(sql)[0])
+
+
+def setup_transpile(sql, read=None, write=None):
+    transpile = make_transpile(Dialect.get_or_raise(read), Dialect.get_or_raise(write or read))
+    return lambda transpile=transpile, sql=sql: transpile(sql)
+
+
+# (group, name) -> (setup function, query name, extra setup arguments)
+BENCHMARKS = {
+    ("parse", "short"): (setup_parse, "short", {}),
+    ("parse", "long"): (setup_parse, "long", {}),
+    ("parse", "tpch"): (setup_parse, "tpch", {}),
+    ("parse_from_tokens", "short"): (setup_parse_from_tokens, "short", {}),
+    ("parse_from_tokens", "long"): (setup_parse_from_tokens, "long", {}),
+    ("parse_from_tokens", "tpch"): (setup_parse_from_tokens, "tpch", {}),
+    ("generate", "short"): (setup_generate, "short", {}),
+    ("generate", "long"): (setup_generate, "long", {}),
+    ("generate", "tpch"): (setup_generate, "tpch", {}),
+    ("parse_and_generate", "short"): (setup_parse_and_generate, "short", {}),
+    ("parse_and_generate", "long"): (setup_parse_and_generate, "long", {}),
+    ("parse_and_generate", "tpch"): (setup_parse_and_generate, "tpch", {}),
+    ("transpile", "postgres_to_mysql"): (
+        setup_transpile,
+        "transpile_postgres_to_mysql",
+        {"read": "postgres", "write": "mysql"},
+    ),
+    ("transpile", "tpch_to_bigquery"): (
+        setup_transpile,
+        "transpile_tpch_to_bigquery",
+        {"write": "bigquery"},
+    ),
+    ("transpile", "tpch_identity"): (setup_transpile, "tpch", {}),
+}
+
+
+def run_one(key):
+    """Run a single benchmark by its (group, name) key and return (group, name, stats)."""
+    setup, query, kwargs = BENCHMARKS[key]
+    return (*key, bench(setup(QUERIES[query], **kwargs)))
+
+
+def run_benchmarks(serial=False, jobs=1):
+    """Run all benchmarks, yielding (group, name, stats) as each one finishes.
+
+    By default every benchmark runs in its own freshly spawned process, so caches warmed
+    by one benchmark don't leak into the next. Benchmarks run one at a time, like the
+    TypeScript suite, so they don't compete for cores, caches and memory bandwidth; pass
+    jobs > 1 to run that many concurrently.
+    """
+    if serial:
+        yield from map(run_one, BENCHMARKS)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(jobs, maxtasksperchild=1) as pool:
+        yield from pool.imap(run_one, BENCHMARKS)
 
 
 if __name__ == "__main__":
-    results = run_benchmarks()
-    print(json.dumps(results, indent=2))
+    parser = argparse.ArgumentParser(description="Run the sqlglot (Python) benchmarks")
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run all benchmarks one after another in this process",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of benchmark processes to run at once (default: 1). Concurrent runs "
+        "skew the timings, so only use this for quick checks",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help='Print one JSON document keyed by "group > name" at the end instead of NDJSON',
+    )
+    args = parser.parse_args()
+
+    if args.json:
+        results = {
+            f"{group} > {name}": stats
+            for group, name, stats in run_benchmarks(serial=args.serial, jobs=args.jobs)
+        }
+        print(json.dumps(results, indent=2))
+    else:
+        # One {"group", "name", "stats"} record per line as soon as a benchmark finishes,
+        # followed by a summary line holding all results as {group: {name: stats}} for
+        # consumers that only want the final mapping
+        results = {}
+        for group, name, stats in run_benchmarks(serial=args.serial, jobs=args.jobs):
+            results.setdefault(group, {})[name] = stats
+            print(json.dumps({"group": group, "name": name, "stats": stats}), flush=True)
+
+        print(json.dumps({"_summary": results}), flush=True)
@@ -6,6 +6,7 @@ Usage:
     python benchmarks/compare.py                  # run both, print table
     python benchmarks/compare.py --json           # output raw JSON
     python benchmarks/compare.py --markdown       # output GitHub-flavored markdown
+    BENCH_CPU=2 python benchmarks/compare.py      # pin the Python benchmarks to CPU 2
 """
 
 import argparse
@@ -13,33 +14,107 @@ import json
 import os
 import subprocess
 import sys
+import threading
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 BENCH_DIR = os.path.join(ROOT, "benchmarks")
 TS_DIR = os.path.join(ROOT, "sqlglot-ts")
 TS_RESULTS_PATH = os.path.join(BENCH_DIR, ".bench_ts_results.json")
 
+# Benchmark groups in the order they're printed in the comparison table
+CATEGORIES = ("parse", "parse_from_tokens", "generate", "parse_and_generate", "transpile")
 
-def run_python_benchmarks():
-    """Run Python benchmarks and return results dict."""
-    print("Running Python benchmarks...", file=sys.stderr)
-    result = subprocess.run(
-        [sys.executable, "-m", "benchmarks.bench_py"],
-        capture_output=True,
+
+def forward_lines(stream):
+    """Copy a child process' output to our stderr line by line, as it's produced."""
+    for line in stream:
+        sys.stderr.write(line)
+        sys.stderr.flush()
+
+
+def run_streaming(cmd, cwd, on_stdout_line=None):
+    """Run cmd, streaming its output instead of buffering it until it exits.
+
+    stderr is forwarded to our stderr. Each stdout line is passed to on_stdout_line if
+    given, otherwise it's forwarded to stderr as well. Returns the exit code.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         text=True,
+        bufsize=1,
+        cwd=cwd,
+    )
+    stderr_thread = threading.Thread(target=forward_lines, args=(proc.stderr,), daemon=True)
+    stderr_thread.start()
+
+    if on_stdout_line:
+        for line in proc.stdout:
+            on_stdout_line(line)
+    else:
+        forward_lines(proc.stdout)
+
+    returncode = proc.wait()
+    stderr_thread.join()
+    return returncode
+
+
+def run_python_benchmarks(jobs=1):
+    """Run Python benchmarks and return {group: {name: stats}}, reporting each as it finishes."""
+    print("Running Python benchmarks...", file=sys.stderr)
+    py_results = {}
+
+    def collect(line):
+        record = json.loads(line)
+        if "group" in record:
+            group, name, stats = record["group"], record["name"], record["stats"]
+            py_results.setdefault(group, {})[name] = stats
+            print(f"  {f'{group} > {name}':<35} {format_time(stats['mean']):>12}", file=sys.stderr)
+
+    returncode = run_streaming(
+        [sys.executable, "-m", "benchmarks.bench_py", "--jobs", str(jobs)],
         cwd=ROOT,
+        on_stdout_line=collect,
     )
-    if result.returncode != 0:
-        print(f"Python benchmark failed:\n{result.stderr}", file=sys.stderr)
+    if returncode != 0:
+        print("Python benchmark failed", file=sys.stderr)
         sys.exit(1)
-    return json.loads(result.stdout)
+    return py_results
+
+
+def iter_ts_groups(path):
+    """Yield the benchmark groups of a vitest bench JSON output file.
+
+    vitest outputs: { files: [{ groups: [{ fullName, benchmarks: [{ name, mean, ... }] }] }] }
+
+    If ijson is installed the file is streamed one group at a time, otherwise it's
+    loaded in full.
+    """
+    if ijson:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "files.item.groups.item", use_float=True)
+        return
+
+    with open(path) as f:
+        raw = json.load(f)
+
+    for file_entry in raw.get("files", []):
+        yield from file_entry.get("groups", [])
 
 
 def run_ts_benchmarks():
-    """Run TypeScript benchmarks via vitest bench and return results dict."""
+    """Run TypeScript benchmarks via vitest bench and return {group: {name: stats}}."""
     print("Running TypeScript benchmarks...", file=sys.stderr)
 
-    result = subprocess.run(
+    # The results are written to TS_RESULTS_PATH, so vitest's console progress is
+    # streamed through as-is
+    returncode = run_streaming(
         [
             "npx",
             "vitest",
@@ -49,43 +124,34 @@ def run_ts_benchmarks():
             "--outputJson",
             TS_RESULTS_PATH,
         ],
-        capture_output=True,
-        text=True,
         cwd=TS_DIR,
     )
-    if result.returncode != 0:
-        print(f"TypeScript benchmark output:\n{result.stdout}", file=sys.stderr)
-        print(f"TypeScript benchmark stderr:\n{result.stderr}", file=sys.stderr)
+    if returncode != 0:
+        print("TypeScript benchmark failed", file=sys.stderr)
         sys.exit(1)
 
-    with open(TS_RESULTS_PATH) as f:
-        raw = json.load(f)
-
     # Parse vitest bench JSON output into our normalized format.
-    # vitest outputs: { files: [{ groups: [{ fullName, benchmarks: [{ name, mean, ... }] }] }] }
     ts_results = {}
-    for file_entry in raw.get("files", []):
-        for group in file_entry.get("groups", []):
-            full_name = group.get("fullName", "")
-            # Extract group name: "benchmarks/bench.bench.ts > parse" → "parse"
-            group_name = full_name.split(" > ")[-1] if " > " in full_name else full_name
-            for bm in group.get("benchmarks", []):
-                task_name = bm.get("name", "")
-                sample_count = bm.get("sampleCount", 0)
-                if sample_count == 0:
-                    continue
-                key = f"{group_name} > {task_name}"
-                # vitest bench reports times in ms
-                mean_ms = bm.get("mean", 0)
-                ts_results[key] = {
-                    "mean": mean_ms / 1000,  # ms → seconds
-                    "median": bm.get("median", mean_ms) / 1000,
-                    "min": bm.get("min", mean_ms) / 1000,
-                    "max": bm.get("max", mean_ms) / 1000,
-                    "stddev": bm.get("sd", 0) / 1000,
-                    "samples": sample_count,
-                    "hz": bm.get("hz", 0),
-                }
+    for group in iter_ts_groups(TS_RESULTS_PATH):
+        full_name = group.get("fullName", "")
+        # Extract group name: "benchmarks/bench.bench.ts > parse" → "parse"
+        group_name = full_name.split(" > ")[-1] if " > " in full_name else full_name
+        group_results = ts_results.setdefault(group_name, {})
+        for bm in group.get("benchmarks", []):
+            sample_count = bm.get("sampleCount", 0)
+            if sample_count == 0:
+                continue
+            # vitest bench reports times in ms
+            mean_ms = bm.get("mean", 0)
+            group_results[bm.get("name", "")] = {
+                "mean": mean_ms / 1000,  # ms → seconds
+                "median": bm.get("median", mean_ms) / 1000,
+                "min": bm.get("min", mean_ms) / 1000,
+                "max": bm.get("max", mean_ms) / 1000,
+                "stddev": bm.get("sd", 0) / 1000,
+                "samples": sample_count,
+                "hz": bm.get("hz", 0),
+            }
 
     # Clean up temp file
     try:
@@ -118,16 +184,39 @@ def ratio_indicator(ratio):
     return "Py 2x+ faster"
 
 
+def compute_rows(py_results, ts_results):
+    """Return (group, name, python, typescript, ratio, result) display rows for all benchmarks."""
+    rows = []
+    for group in sorted(py_results.keys() | ts_results.keys()):
+        py_group = py_results.get(group, {})
+        ts_group = ts_results.get(group, {})
+
+        for name in sorted(py_group.keys() | ts_group.keys()):
+            py_mean = py_group.get(name, {}).get("mean", 0)
+            ts_mean = ts_group.get(name, {}).get("mean", 0)
+
+            py_str = format_time(py_mean) if py_mean else "N/A"
+            ts_str = format_time(ts_mean) if ts_mean else "N/A"
+
+            if py_mean and ts_mean:
+                ratio = py_mean / ts_mean
+                ratio_str = f"{ratio:.2f}x"
+                indicator = ratio_indicator(ratio)
+            else:
+                ratio_str = "N/A"
+                indicator = ""
+
+            rows.append((group, name, py_str, ts_str, ratio_str, indicator))
+
+    return rows
+
+
 def print_table(py_results, ts_results):
     """Print a formatted comparison table."""
-    # Collect all benchmark names (union of both)
-    all_keys = sorted(set(list(py_results.keys()) + list(ts_results.keys())))
-
     # Group by category
     categories = {}
-    for key in all_keys:
-        cat = key.split(" > ")[0] if " > " in key else "other"
-        categories.setdefault(cat, []).append(key)
+    for group, *row in compute_rows(py_results, ts_results):
+        categories.setdefault(group, []).append(row)
 
     header = f"{'Benchmark':<35} {'Python':>12} {'TypeScript':>12} {'Ratio (Py/TS)':>15} {'Result':>18}"
     sep = "-" * len(header)
@@ -138,65 +227,30 @@ def print_table(py_results, ts_results):
     print("=" * len(header))
     print()
 
-    for cat in ("parse", "generate", "transpile", "other"):
-        if cat not in categories:
-            continue
-        keys = categories[cat]
+    # Known categories first, in pipeline order, then any others alphabetically
+    ordered = [cat for cat in CATEGORIES if cat in categories]
+    ordered += sorted(categories.keys() - set(CATEGORIES))
+
+    for cat in ordered:
         print(f"  {cat.upper()}")
         print(f"  {sep}")
         print(f"  {header}")
         print(f"  {sep}")
 
-        for key in keys:
-            short_name = key.split(" > ")[1] if " > " in key else key
-            py = py_results.get(key, {})
-            ts = ts_results.get(key, {})
-
-            py_mean = py.get("mean", 0)
-            ts_mean = ts.get("mean", 0)
-
-            py_str = format_time(py_mean) if py_mean else "N/A"
-            ts_str = format_time(ts_mean) if ts_mean else "N/A"
-
-            if py_mean and ts_mean:
-                ratio = py_mean / ts_mean
-                ratio_str = f"{ratio:.2f}x"
-                indicator = ratio_indicator(ratio)
-            else:
-                ratio_str = "N/A"
-                indicator = ""
-
-            print(f"  {short_name:<35} {py_str:>12} {ts_str:>12} {ratio_str:>15} {indicator:>18}")
+        for name, py_str, ts_str, ratio_str, indicator in categories[cat]:
+            print(f"  {name:<35} {py_str:>12} {ts_str:>12} {ratio_str:>15} {indicator:>18}")
 
         print()
 
 
 def print_markdown(py_results, ts_results):
     """Print a GitHub-flavored markdown comparison table."""
-    all_keys = sorted(set(list(py_results.keys()) + list(ts_results.keys())))
-
     print("## sqlglot (Python) vs sqlglot-ts (TypeScript) Benchmark Comparison\n")
     print("| Benchmark | Python | TypeScript | Ratio (Py/TS) | Result |")
     print("|-----------|-------:|-----------:|--------------:|--------|")
 
-    for key in all_keys:
-        py = py_results.get(key, {})
-        ts = ts_results.get(key, {})
-        py_mean = py.get("mean", 0)
-        ts_mean = ts.get("mean", 0)
-
-        py_str = format_time(py_mean) if py_mean else "N/A"
-        ts_str = format_time(ts_mean) if ts_mean else "N/A"
-
-        if py_mean and ts_mean:
-            ratio = py_mean / ts_mean
-            ratio_str = f"{ratio:.2f}x"
-            indicator = ratio_indicator(ratio)
-        else:
-            ratio_str = "N/A"
-            indicator = ""
-
-        print(f"| {key} | {py_str} | {ts_str} | {ratio_str} | {indicator} |")
+    for group, name, py_str, ts_str, ratio_str, indicator in compute_rows(py_results, ts_results):
+        print(f"| {group} > {name} | {py_str} | {ts_str} | {ratio_str} | {indicator} |")
 
 
 def main():
@@ -213,9 +267,15 @@ def main():
     parser.add_argument(
         "--ts-only", action="store_true", help="Run only TypeScript benchmarks"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of Python benchmarks to run at once (default: 1, matching the TS suite)",
+    )
     args = parser.parse_args()
 
-    py_results = {} if args.ts_only else run_python_benchmarks()
+    py_results = {} if args.ts_only else run_python_benchmarks(args.jobs)
     ts_results = {} if args.py_only else run_ts_benchmarks()
 
     if args.json:
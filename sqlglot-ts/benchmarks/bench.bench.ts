@@ -1,11 +1,13 @@
 /**
  * sqlglot-ts benchmarks — run via `vitest bench` from the sqlglot-ts directory.
  *
- * Measures: parse, generate (parse→sql), and cross-dialect transpile.
+ * Measures: parse, parse_from_tokens (parse a pre-tokenized query), generate
+ * (sql() on a pre-parsed tree), parse_and_generate (parse→sql), and
+ * cross-dialect transpile.
  * Uses the same SQL queries as the Python benchmarks for apples-to-apples comparison.
  */
 import { bench, describe } from "vitest";
-import { parseOne, transpile } from "../src/index.js";
+import { Dialect, Parser, parseOne, transpile } from "../src/index.js";
 import { readFileSync } from "node:fs";
 import { resolve, dirname } from "node:path";
 import { fileURLToPath } from "node:url";
@@ -33,9 +35,53 @@ describe("parse", () => {
 });
 
 // ---------------------------------------------------------------------------
-// Generate benchmarks — parse then generate SQL back
+// Parse-from-tokens benchmarks — parse a query tokenized once up front
+// ---------------------------------------------------------------------------
+describe("parse_from_tokens", () => {
+  const dialect = Dialect.getOrRaise();
+  const parser = new Parser(dialect);
+  const short = dialect.tokenize(queries.short);
+  const long = dialect.tokenize(queries.long);
+  const tpch = dialect.tokenize(queries.tpch);
+
+  bench("short", () => {
+    parser.parse(short, queries.short);
+  });
+
+  bench("long", () => {
+    parser.parse(long, queries.long);
+  });
+
+  bench("tpch", () => {
+    parser.parse(tpch, queries.tpch);
+  });
+});
+
+// ---------------------------------------------------------------------------
+// Generate benchmarks — generate SQL from a tree parsed once up front
 // ---------------------------------------------------------------------------
 describe("generate", () => {
+  const short = parseOne(queries.short);
+  const long = parseOne(queries.long);
+  const tpch = parseOne(queries.tpch);
+
+  bench("short", () => {
+    short.sql();
+  });
+
+  bench("long", () => {
+    long.sql();
+  });
+
+  bench("tpch", () => {
+    tpch.sql();
+  });
+});
+
+// ---------------------------------------------------------------------------
+// Parse + generate benchmarks — parse then generate SQL back
+// ---------------------------------------------------------------------------
+describe("parse_and_generate", () => {
   bench("short", () => {
     parseOne(queries.short).sql();
   });